@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+
+# Measures the per-chunk cost of producing the upload body in `myThread.gen_data`, for short and long utterances
+# The cost of each chunk should stay flat as utterances get longer; the old implementation rebuilt the list of all chunks for every chunk it sent
+
+import os, timeit
+import speech_recognition as sr
+
+FLAC_BYTES_PER_SECOND = 19200 # roughly what 16 kHz 16-bit speech compresses to
+CHUNK_SIZE = 8192
+
+def old_gen_data(flac_data): # the previous implementation, without the dummy data sent after the audio
+    counter = 0
+    while True:
+        info = [flac_data[i:i+CHUNK_SIZE] for i in range(0, len(flac_data), CHUNK_SIZE)]
+        if counter >= len(info): return
+        yield info[counter]
+        counter += 1
+
+def new_gen_data(flac_data):
+    thread = threads.get(len(flac_data))
+    if thread is None:
+        thread = threads[len(flac_data)] = sr.Recognizer.myThread(sr.AudioData(b"", 16000, 2), flac_data = flac_data)
+        thread.no_result = True # stop right after the audio data, rather than sending dummy data
+    return thread.gen_data()
+threads = {} # created once per utterance length, so that thread creation isn't measured
+
+for seconds in [1, 60]:
+    flac_data = os.urandom(FLAC_BYTES_PER_SECOND * seconds)
+    chunk_count = -(-len(flac_data) // CHUNK_SIZE)
+    for name, generator in [("old", old_gen_data), ("new", new_gen_data)]:
+        repeat = max(1, 200 // seconds)
+        elapsed = min(timeit.repeat(lambda: sum(len(chunk) for chunk in generator(flac_data)), number = repeat, repeat = 3)) / repeat
+        print("{0} {1:>2} s utterance: {2:>3} chunks, {3:8.2f} us per chunk".format(name, seconds, chunk_count, elapsed * 1e6 / chunk_count))
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+
+# Measures how long it takes to scan a 10 minute WAV file for speech, the way `listen` waits for a phrase with a dynamic energy threshold
+# The old loop read and measured one buffer at a time; `VoiceActivityDetector` reads 64 buffers at once from files and measures them together
+
+import io, math, random, struct, timeit, wave, audioop
+import speech_recognition as sr
+
+SAMPLE_RATE = 16000
+SECONDS = 600
+
+def make_wav(): # alternating noise and louder tones, so that the threshold keeps changing
+    random.seed(0)
+    noise = struct.pack("<{0}h".format(SAMPLE_RATE), *[random.randint(-200, 200) for i in range(SAMPLE_RATE)])
+    tone = struct.pack("<{0}h".format(SAMPLE_RATE), *[int(4000 * math.sin(i * 0.1)) for i in range(SAMPLE_RATE)])
+    wav_file = io.BytesIO()
+    wav_writer = wave.open(wav_file, "wb")
+    wav_writer.setnchannels(1)
+    wav_writer.setsampwidth(2)
+    wav_writer.setframerate(SAMPLE_RATE)
+    wav_writer.writeframes(b"".join(tone if i % 5 == 0 else noise for i in range(SECONDS)))
+    wav_writer.close()
+    return wav_file.getvalue()
+
+def old_scan(source, recognizer): # the previous implementation
+    seconds_per_buffer = (source.CHUNK + 0.0) / source.SAMPLE_RATE
+    threshold, speech = recognizer.energy_threshold, 0
+    while True:
+        buffer = source.stream.read(source.CHUNK)
+        if len(buffer) == 0: break
+        energy = audioop.rms(buffer, source.SAMPLE_WIDTH)
+        if energy > threshold: speech += 1; continue
+        damping = recognizer.dynamic_energy_adjustment_damping ** seconds_per_buffer
+        target_energy = energy * recognizer.dynamic_energy_ratio
+        threshold = threshold * damping + target_energy * (1 - damping)
+    return speech
+
+def new_scan(source, recognizer):
+    seconds_per_buffer = (source.CHUNK + 0.0) / source.SAMPLE_RATE
+    damping = recognizer.dynamic_energy_adjustment_damping ** seconds_per_buffer
+    detector = sr.VoiceActivityDetector(source)
+    threshold, speech = recognizer.energy_threshold, 0
+    while True:
+        buffer, energy = detector.read()
+        if len(buffer) == 0: break
+        if energy > threshold: speech += 1; continue
+        target_energy = energy * recognizer.dynamic_energy_ratio
+        threshold = threshold * damping + target_energy * (1 - damping)
+    return speech
+
+wav_data = make_wav()
+recognizer = sr.Recognizer()
+for chunk in [1024, 4096]:
+    results = {}
+    for name, scan in [("old", old_scan), ("new", new_scan)]:
+        def run():
+            with sr.WavFile(io.BytesIO(wav_data)) as source:
+                source.CHUNK = chunk
+                results[name] = scan(source, recognizer)
+        elapsed = min(timeit.repeat(run, number = 1, repeat = 5))
+        print("{0} CHUNK = {1}: {2:7.1f} ms for {3} s of audio".format(name, chunk, elapsed * 1000, SECONDS))
+    assert results["old"] == results["new"], "both loops should find the same speech"
+print("NumPy: {0}".format("installed" if sr.get_numpy() is not None else "not installed, energies are computed with audioop"))
@@ -23,7 +23,7 @@ def noalsaerr():
     asound.snd_lib_error_set_handler(None)
 
 with noalsaerr():
-    m = sr.Microphone()
+    m = sr.Microphone(keep_open = True) # the script enters `m` again for every utterance
     # c = sr.Recognizer()
     r = sr.Recognizer()
     with m as source:
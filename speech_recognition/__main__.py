@@ -1,29 +1,61 @@
+import sys, argparse
 import speech_recognition as sr
 
-r = sr.Recognizer()
-m = sr.Microphone()
+def batch(arguments):
+    parser = argparse.ArgumentParser(prog = "python -m speech_recognition batch", description = "Transcribe every WAV, AIFF and FLAC file in a directory, appending the results to a JSON Lines file. Running the same command again resumes where it stopped.")
+    parser.add_argument("directory", help = "directory containing the audio files, which is searched recursively")
+    parser.add_argument("-o", "--output", default = "transcripts.jsonl", help = "JSON Lines file that the results are appended to (default: transcripts.jsonl)")
+    parser.add_argument("-b", "--backend", default = "google", help = "recognition service, such as google, wit, ibm or att (default: google)")
+    parser.add_argument("--option", action = "append", default = [], metavar = "NAME=VALUE", help = "argument for the recognize_* method of the backend, such as key=... or language=en-GB; can be given several times")
+    parser.add_argument("-p", "--processes", type = int, default = None, help = "worker processes that split and encode the files (default: one per CPU core)")
+    parser.add_argument("-n", "--in-flight", type = int, default = 8, help = "maximum number of recognition requests in flight at a time (default: 8)")
+    parser.add_argument("--energy-threshold", type = float, default = 300, help = "minimum audio energy considered to be speech (default: 300)")
+    parser.add_argument("--pause-threshold", type = float, default = 0.8, help = "seconds of non-speaking audio that end a phrase (default: 0.8)")
+    args = parser.parse_args(arguments)
 
-try:
-    print("A moment of silence, please...")
-    with m as source:
-        r.adjust_for_ambient_noise(source)
-        print("Set minimum energy threshold to {}".format(r.energy_threshold))
-        while True:
-            print("Say something!")
-            audio = r.listen(source)
-            print("Got it! Now to recognize it...")
-            try:
-                # recognize speech using Google Speech Recognition
-                value = r.recognize_google(audio)
+    r = sr.Recognizer()
+    r.energy_threshold = args.energy_threshold
+    r.pause_threshold = args.pause_threshold
+    r.non_speaking_duration = min(r.non_speaking_duration, args.pause_threshold)
+    options = dict(option.split("=", 1) for option in args.option)
+    transcriber = sr.BatchTranscriber(r, args.output, args.backend, options, args.processes, args.in_flight)
 
-                # we need some special handling here to correctly print unicode characters to standard output
-                if str is bytes: # this version of Python uses bytes for strings (Python 2)
-                    print(u"You said {}".format(value).encode("utf-8"))
-                else: # this version of Python uses unicode for strings (Python 3+)
-                    print("You said {}".format(value))
-            except sr.UnknownValueError:
-                print("Oops! Didn't catch that")
-            except sr.RequestError as e:
-                print("Uh oh! Couldn't request results from Google Speech Recognition service; {0}".format(e))
-except KeyboardInterrupt:
-    pass
+    def progress(stats):
+        sys.stderr.write("{files} files, {phrases} phrases, {errors} errors: {audio_seconds:.1f} s of audio in {wall_seconds:.1f} s ({speed:.1f} audio seconds per second)\n".format(**stats))
+    stats = transcriber.run(args.directory, progress)
+    print("Transcribed {files} files ({audio_seconds:.1f} s of audio) in {wall_seconds:.1f} s: {speed:.1f} audio seconds per second".format(**stats))
+
+def listen_loop():
+    r = sr.Recognizer()
+    m = sr.Microphone()
+
+    try:
+        print("A moment of silence, please...")
+        with m as source:
+            r.adjust_for_ambient_noise(source)
+            print("Set minimum energy threshold to {}".format(r.energy_threshold))
+            while True:
+                print("Say something!")
+                audio = r.listen(source)
+                print("Got it! Now to recognize it...")
+                try:
+                    # recognize speech using Google Speech Recognition
+                    value = r.recognize_google(audio)
+
+                    # we need some special handling here to correctly print unicode characters to standard output
+                    if str is bytes: # this version of Python uses bytes for strings (Python 2)
+                        print(u"You said {}".format(value).encode("utf-8"))
+                    else: # this version of Python uses unicode for strings (Python 3+)
+                        print("You said {}".format(value))
+                except sr.UnknownValueError:
+                    print("Oops! Didn't catch that")
+                except sr.RequestError as e:
+                    print("Uh oh! Couldn't request results from Google Speech Recognition service; {0}".format(e))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "batch": # python -m speech_recognition batch <dir>
+        batch(sys.argv[2:])
+    else:
+        listen_loop()
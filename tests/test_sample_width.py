@@ -0,0 +1,30 @@
+import unittest, struct, math
+
+import speech_recognition as sr
+
+class TestSampleWidth(unittest.TestCase):
+    def setUp(self):
+        self.samples = [int(3000000 * math.sin(i / 7.0)) for i in range(4410)] + [-2 ** 23, 2 ** 23 - 1, 0, -1]
+        self.frame_data = b"".join(struct.pack("<i", sample)[:3] for sample in self.samples) # 24-bit little-endian
+
+    def test_convert_24_bit(self):
+        for sample_width, sample_type in ((1, "b"), (2, "h"), (4, "i")):
+            converted = sr.convert_sample_width(self.frame_data, 3, sample_width)
+            expected = [sample << 8 if sample_width == 4 else sample >> (24 - 8 * sample_width) for sample in self.samples]
+            self.assertEqual(list(struct.unpack("<{0}{1}".format(len(self.samples), sample_type), converted)), expected)
+        self.assertEqual(sr.convert_sample_width(sr.convert_sample_width(self.frame_data, 3, 4), 4, 3), self.frame_data)
+
+    def test_prepare_24_bit_audio(self):
+        audio_data = sr.AudioData(self.frame_data, 44100, 3)
+        prepared = sr.Recognizer().prepare_audio(audio_data, "google")
+        self.assertEqual(prepared.sample_width, 2)
+        self.assertTrue(prepared.get_flac_data().startswith(b"fLaC"))
+
+    def test_convert_to_24_bit(self):
+        converter = sr.AudioConverter(16000, 2, 8000, 3)
+        converted = converter.convert(struct.pack("<1000h", *range(-500, 500))) + converter.finish()
+        self.assertEqual(len(converted) % 3, 0)
+        self.assertTrue(len(converted) > 0)
+
+if __name__ == "__main__":
+    unittest.main()